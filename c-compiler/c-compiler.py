@@ -15,139 +15,145 @@ Author: Anim-101
 License: MIT
 """
 
+import array
+import bisect
 import sys
-import os
 import re
 import enum
-from typing import List, Dict, Optional, Union, Any, Set
+from typing import List, Dict, NamedTuple, Optional, Tuple, Union, Set
 from dataclasses import dataclass
-from abc import ABC, abstractmethod
 
 # ============================================================================
 # TOKEN DEFINITIONS
 # ============================================================================
 
-class TokenType(enum.Enum):
+class TokenType(enum.IntEnum):
+    """Token kinds as an IntEnum.
+
+    Members compare as plain C-level ints (the enum's string spellings live
+    in the lexer's KEYWORD_TT/OPERATOR_TT tables instead), which makes the
+    type checks that dominate the parser's hot loops cheap.
+    """
     # Literals
-    INTEGER = "INTEGER"
-    FLOAT = "FLOAT" 
-    CHAR = "CHAR"
-    STRING = "STRING"
-    
+    INTEGER = enum.auto()
+    FLOAT = enum.auto()
+    CHAR = enum.auto()
+    STRING = enum.auto()
+
     # Identifiers and Keywords
-    IDENTIFIER = "IDENTIFIER"
-    
+    IDENTIFIER = enum.auto()
+
     # C Keywords
-    AUTO = "auto"
-    BREAK = "break"
-    CASE = "case"
-    CHAR_KW = "char"
-    CONST = "const"
-    CONTINUE = "continue"
-    DEFAULT = "default"
-    DO = "do"
-    DOUBLE = "double"
-    ELSE = "else"
-    ENUM = "enum"
-    EXTERN = "extern"
-    FLOAT_KW = "float"
-    FOR = "for"
-    GOTO = "goto"
-    IF = "if"
-    INT = "int"
-    LONG = "long"
-    REGISTER = "register"
-    RETURN = "return"
-    SHORT = "short"
-    SIGNED = "signed"
-    SIZEOF = "sizeof"
-    STATIC = "static"
-    STRUCT = "struct"
-    SWITCH = "switch"
-    TYPEDEF = "typedef"
-    UNION = "union"
-    UNSIGNED = "unsigned"
-    VOID = "void"
-    VOLATILE = "volatile"
-    WHILE = "while"
-    
+    AUTO = enum.auto()
+    BREAK = enum.auto()
+    CASE = enum.auto()
+    CHAR_KW = enum.auto()
+    CONST = enum.auto()
+    CONTINUE = enum.auto()
+    DEFAULT = enum.auto()
+    DO = enum.auto()
+    DOUBLE = enum.auto()
+    ELSE = enum.auto()
+    ENUM = enum.auto()
+    EXTERN = enum.auto()
+    FLOAT_KW = enum.auto()
+    FOR = enum.auto()
+    GOTO = enum.auto()
+    IF = enum.auto()
+    INT = enum.auto()
+    LONG = enum.auto()
+    REGISTER = enum.auto()
+    RETURN = enum.auto()
+    SHORT = enum.auto()
+    SIGNED = enum.auto()
+    SIZEOF = enum.auto()
+    STATIC = enum.auto()
+    STRUCT = enum.auto()
+    SWITCH = enum.auto()
+    TYPEDEF = enum.auto()
+    UNION = enum.auto()
+    UNSIGNED = enum.auto()
+    VOID = enum.auto()
+    VOLATILE = enum.auto()
+    WHILE = enum.auto()
+
     # Operators
-    PLUS = "+"
-    MINUS = "-"
-    MULTIPLY = "*"
-    DIVIDE = "/"
-    MODULO = "%"
-    
+    PLUS = enum.auto()
+    MINUS = enum.auto()
+    MULTIPLY = enum.auto()
+    DIVIDE = enum.auto()
+    MODULO = enum.auto()
+
     # Assignment Operators
-    ASSIGN = "="
-    PLUS_ASSIGN = "+="
-    MINUS_ASSIGN = "-="
-    MULT_ASSIGN = "*="
-    DIV_ASSIGN = "/="
-    MOD_ASSIGN = "%="
-    
+    ASSIGN = enum.auto()
+    PLUS_ASSIGN = enum.auto()
+    MINUS_ASSIGN = enum.auto()
+    MULT_ASSIGN = enum.auto()
+    DIV_ASSIGN = enum.auto()
+    MOD_ASSIGN = enum.auto()
+
     # Comparison Operators
-    EQUAL = "=="
-    NOT_EQUAL = "!="
-    LESS_THAN = "<"
-    GREATER_THAN = ">"
-    LESS_EQUAL = "<="
-    GREATER_EQUAL = ">="
-    
+    EQUAL = enum.auto()
+    NOT_EQUAL = enum.auto()
+    LESS_THAN = enum.auto()
+    GREATER_THAN = enum.auto()
+    LESS_EQUAL = enum.auto()
+    GREATER_EQUAL = enum.auto()
+
     # Logical Operators
-    LOGICAL_AND = "&&"
-    LOGICAL_OR = "||"
-    LOGICAL_NOT = "!"
-    
+    LOGICAL_AND = enum.auto()
+    LOGICAL_OR = enum.auto()
+    LOGICAL_NOT = enum.auto()
+
     # Bitwise Operators
-    BITWISE_AND = "&"
-    BITWISE_OR = "|"
-    BITWISE_XOR = "^"
-    BITWISE_NOT = "~"
-    LEFT_SHIFT = "<<"
-    RIGHT_SHIFT = ">>"
-    
+    BITWISE_AND = enum.auto()
+    BITWISE_OR = enum.auto()
+    BITWISE_XOR = enum.auto()
+    BITWISE_NOT = enum.auto()
+    LEFT_SHIFT = enum.auto()
+    RIGHT_SHIFT = enum.auto()
+
     # Increment/Decrement
-    INCREMENT = "++"
-    DECREMENT = "--"
-    
+    INCREMENT = enum.auto()
+    DECREMENT = enum.auto()
+
     # Punctuation
-    SEMICOLON = ";"
-    COMMA = ","
-    DOT = "."
-    ARROW = "->"
-    
+    SEMICOLON = enum.auto()
+    COMMA = enum.auto()
+    DOT = enum.auto()
+    ARROW = enum.auto()
+
     # Brackets
-    LEFT_PAREN = "("
-    RIGHT_PAREN = ")"
-    LEFT_BRACE = "{"
-    RIGHT_BRACE = "}"
-    LEFT_BRACKET = "["
-    RIGHT_BRACKET = "]"
-    
+    LEFT_PAREN = enum.auto()
+    RIGHT_PAREN = enum.auto()
+    LEFT_BRACE = enum.auto()
+    RIGHT_BRACE = enum.auto()
+    LEFT_BRACKET = enum.auto()
+    RIGHT_BRACKET = enum.auto()
+
     # Special
-    QUESTION = "?"
-    COLON = ":"
-    
+    QUESTION = enum.auto()
+    COLON = enum.auto()
+
     # Preprocessor
-    HASH = "#"
-    
+    HASH = enum.auto()
+
     # End of file
-    EOF = "EOF"
-    
-    # Whitespace (usually ignored)
-    WHITESPACE = "WHITESPACE"
-    NEWLINE = "NEWLINE"
-    COMMENT = "COMMENT"
+    EOF = enum.auto()
 
-@dataclass
-class Token:
-    """Represents a token with its type, value, and location info."""
+class Token(NamedTuple):
+    """Represents a token with its type, value, and location info.
+
+    A NamedTuple rather than a class: tokens are created in bulk by the
+    lexer and never mutated afterwards, and tuple construction skips the
+    per-field __init__ setattr work while staying just as small as the
+    previous __slots__ version.
+    """
     type: TokenType
     value: str
     line: int
     column: int
-    
+
     def __str__(self):
         return f"Token({self.type.name}, '{self.value}', {self.line}:{self.column})"
 
@@ -155,65 +161,74 @@ class Token:
 # ABSTRACT SYNTAX TREE NODES
 # ============================================================================
 
-class ASTNode(ABC):
-    """Base class for all AST nodes."""
-    pass
+class ASTNode:
+    """Base class for all AST nodes.
 
-@dataclass
+    Declares empty __slots__ so subclasses generated with
+    @dataclass(slots=True) stay dict-free: realistic sources produce huge
+    node counts, and dropping per-node __dict__ cuts AST memory roughly in
+    half while speeding up attribute access in every later pass.
+    """
+    __slots__ = ()
+
+@dataclass(slots=True)
 class Program(ASTNode):
     """Root node of the AST representing the entire program."""
     declarations: List[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class FunctionDeclaration(ASTNode):
     """Function declaration/definition."""
     return_type: str
     name: str
-    parameters: List['Parameter']
+    parameters: Tuple['Parameter', ...]
     body: Optional['CompoundStatement']
+    ctype: Optional['CType'] = None  # resolved return type, set by the analyzer
 
-@dataclass 
+@dataclass(slots=True)
 class Parameter(ASTNode):
     """Function parameter."""
     type: str
     name: str
+    ctype: Optional['CType'] = None  # resolved type, set by the analyzer
 
-@dataclass
+@dataclass(slots=True)
 class VariableDeclaration(ASTNode):
     """Variable declaration."""
     type: str
     name: str
     initializer: Optional[ASTNode] = None
+    ctype: Optional['CType'] = None  # resolved type, set by the analyzer
 
-@dataclass
+@dataclass(slots=True)
 class CompoundStatement(ASTNode):
     """Block statement with curly braces."""
     statements: List[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class ExpressionStatement(ASTNode):
     """Statement containing an expression."""
     expression: ASTNode
 
-@dataclass
+@dataclass(slots=True)
 class ReturnStatement(ASTNode):
     """Return statement."""
     expression: Optional[ASTNode]
 
-@dataclass
+@dataclass(slots=True)
 class IfStatement(ASTNode):
     """If statement with optional else clause."""
     condition: ASTNode
     then_statement: ASTNode
     else_statement: Optional[ASTNode] = None
 
-@dataclass
+@dataclass(slots=True)
 class WhileStatement(ASTNode):
     """While loop statement."""
     condition: ASTNode
     body: ASTNode
 
-@dataclass
+@dataclass(slots=True)
 class ForStatement(ASTNode):
     """For loop statement."""
     init: Optional[ASTNode]
@@ -221,53 +236,53 @@ class ForStatement(ASTNode):
     update: Optional[ASTNode]
     body: ASTNode
 
-@dataclass
+@dataclass(slots=True)
 class BinaryExpression(ASTNode):
     """Binary operation expression."""
     left: ASTNode
     operator: str
     right: ASTNode
 
-@dataclass
+@dataclass(slots=True)
 class UnaryExpression(ASTNode):
     """Unary operation expression."""
     operator: str
     operand: ASTNode
 
-@dataclass
+@dataclass(slots=True)
 class AssignmentExpression(ASTNode):
     """Assignment expression."""
     left: ASTNode
     operator: str
     right: ASTNode
 
-@dataclass
+@dataclass(slots=True)
 class CallExpression(ASTNode):
     """Function call expression."""
     function: ASTNode
-    arguments: List[ASTNode]
+    arguments: Tuple[ASTNode, ...]
 
-@dataclass
+@dataclass(slots=True)
 class Identifier(ASTNode):
     """Identifier expression."""
     name: str
 
-@dataclass
+@dataclass(slots=True)
 class IntegerLiteral(ASTNode):
     """Integer literal expression."""
     value: int
 
-@dataclass
+@dataclass(slots=True)
 class FloatLiteral(ASTNode):
     """Float literal expression."""
     value: float
 
-@dataclass
+@dataclass(slots=True)
 class StringLiteral(ASTNode):
     """String literal expression."""
     value: str
 
-@dataclass
+@dataclass(slots=True)
 class CharLiteral(ASTNode):
     """Character literal expression."""
     value: str
@@ -287,6 +302,90 @@ class ParseError(Exception):
 # RECURSIVE DESCENT PARSER
 # ============================================================================
 
+def _mask(*token_types: TokenType) -> int:
+    """Fold token types into an integer bitmask (one bit per TokenType)."""
+    mask = 0
+    for token_type in token_types:
+        mask |= 1 << token_type
+    return mask
+
+# Precomputed match sets for the parser's hot membership tests: a single
+# shift-and-AND replaces a Python-level linear scan over a tuple of enums.
+_TYPE_START_MASK = _mask(TokenType.INT, TokenType.FLOAT_KW, TokenType.CHAR_KW,
+                         TokenType.VOID, TokenType.DOUBLE)
+_SYNC_START_MASK = _mask(TokenType.IF, TokenType.FOR, TokenType.WHILE,
+                         TokenType.RETURN, TokenType.INT, TokenType.FLOAT_KW,
+                         TokenType.CHAR_KW, TokenType.VOID)
+_ASSIGN_OP_MASK = _mask(TokenType.ASSIGN, TokenType.PLUS_ASSIGN,
+                        TokenType.MINUS_ASSIGN, TokenType.MULT_ASSIGN,
+                        TokenType.DIV_ASSIGN, TokenType.MOD_ASSIGN)
+_UNARY_OP_MASK = _mask(TokenType.LOGICAL_NOT, TokenType.MINUS,
+                       TokenType.INCREMENT, TokenType.DECREMENT)
+_INCDEC_MASK = _mask(TokenType.INCREMENT, TokenType.DECREMENT)
+
+# Error recovery scans for these as raw bytes over a type-encoded buffer
+# (every TokenType fits in one byte), letting synchronize() jump to the
+# next boundary with C-level find/search instead of a per-token loop.
+_SEMICOLON_BYTE = bytes([TokenType.SEMICOLON])
+_SYNC_SCAN_RE = re.compile(
+    b'[' + re.escape(bytes([TokenType.IF, TokenType.FOR, TokenType.WHILE,
+                            TokenType.RETURN, TokenType.INT,
+                            TokenType.FLOAT_KW, TokenType.CHAR_KW,
+                            TokenType.VOID, TokenType.EOF])) + b']')
+
+# Binding strength for left-associative binary operators, tighter binds
+# higher. Drives parse_binary's precedence-climbing loop; the levels mirror
+# the old logical_or .. multiplicative cascade exactly.
+_BINARY_PRECEDENCE = {
+    TokenType.LOGICAL_OR: 1,
+    TokenType.LOGICAL_AND: 2,
+    TokenType.EQUAL: 3, TokenType.NOT_EQUAL: 3,
+    TokenType.LESS_THAN: 4, TokenType.GREATER_THAN: 4,
+    TokenType.LESS_EQUAL: 4, TokenType.GREATER_EQUAL: 4,
+    TokenType.PLUS: 5, TokenType.MINUS: 5,
+    TokenType.MULTIPLY: 6, TokenType.DIVIDE: 6, TokenType.MODULO: 6,
+}
+
+# Int aliases for the token types the parser compares against most often:
+# resolving one module-level name is cheaper than the enum-class attribute
+# lookup on every advance/consume.
+_TT_EOF = TokenType.EOF
+_TT_SEMICOLON = TokenType.SEMICOLON
+_TT_RIGHT_PAREN = TokenType.RIGHT_PAREN
+_TT_IDENTIFIER = TokenType.IDENTIFIER
+_TT_INTEGER = TokenType.INTEGER
+_TT_COMMA = TokenType.COMMA
+
+def memoize(parse_method):
+    """Opt-in packrat memoization for parameterless parse methods.
+
+    Caches (node, end position) keyed by (rule name, start position) so a
+    nonterminal re-tried at the same spot is answered from the table instead
+    of re-parsed. Only successful parses are cached; failures propagate as
+    usual. Disabled unless the Parser was built with memoize=True, since the
+    bookkeeping is pure overhead on non-backtracking inputs.
+    """
+    rule = parse_method.__name__
+
+    def wrapper(self):
+        memo = self._memo
+        if memo is None:
+            return parse_method(self)
+        key = (rule, self.current)
+        hit = memo.get(key)
+        if hit is not None:
+            node, end = hit
+            self.current = end
+            self.current_token = self.tokens[end]
+            return node
+        node = parse_method(self)
+        memo[key] = (node, self.current)
+        return node
+
+    wrapper.__name__ = rule
+    wrapper.__doc__ = parse_method.__doc__
+    return wrapper
+
 class Parser:
     """
     Recursive Descent Parser for C language.
@@ -315,13 +414,10 @@ class Parser:
     for_stmt         ::= 'for' '(' expression? ';' expression? ';' expression? ')' statement
     
     expression       ::= assignment_expr
-    assignment_expr  ::= logical_or_expr (('=' | '+=' | '-=' | '*=' | '/=') logical_or_expr)*
-    logical_or_expr  ::= logical_and_expr ('||' logical_and_expr)*
-    logical_and_expr ::= equality_expr ('&&' equality_expr)*
-    equality_expr    ::= relational_expr (('==' | '!=') relational_expr)*
-    relational_expr  ::= additive_expr (('<' | '>' | '<=' | '>=') additive_expr)*
-    additive_expr    ::= multiplicative_expr (('+' | '-') multiplicative_expr)*
-    multiplicative_expr ::= unary_expr (('*' | '/' | '%') unary_expr)*
+    assignment_expr  ::= binary_expr (('=' | '+=' | '-=' | '*=' | '/=') binary_expr)*
+    binary_expr      ::= unary_expr (binary_op unary_expr)*   ; precedence climbing
+    binary_op        ::= '||' | '&&' | '==' | '!=' | '<' | '>' | '<=' | '>='
+                       | '+' | '-' | '*' | '/' | '%'          ; see _BINARY_PRECEDENCE
     unary_expr       ::= ('!' | '-' | '++' | '--') unary_expr | postfix_expr
     postfix_expr     ::= primary_expr ('(' argument_list? ')' | '++' | '--')*
     primary_expr     ::= IDENTIFIER | INTEGER | FLOAT | CHAR | STRING | 
@@ -331,18 +427,37 @@ class Parser:
     type             ::= 'int' | 'float' | 'char' | 'void' | 'double'
     """
     
-    def __init__(self, tokens: List[Token]):
+    def __init__(self, tokens: List[Token], memoize: bool = False):
+        # Guarantee an EOF sentinel at the end so advance() can rely on it
+        # instead of bounds-checking against len(tokens) on every step.
+        if not tokens or tokens[-1].type != TokenType.EOF:
+            tokens = list(tokens)
+            tokens.append(Token(TokenType.EOF, "", 0, 0))
         self.tokens = tokens
         self.current = 0
-        self.current_token = tokens[0] if tokens else Token(TokenType.EOF, "", 0, 0)
+        self.current_token = tokens[0]
+        # Pre-extracted token fields (structure-of-arrays): the match
+        # predicates and hot expression loops index these lists instead of
+        # loading .type/.value off a Token object each call.
+        self.types = [t.type for t in tokens]
+        self.values = [t.value for t in tokens]
+        # Byte-encoded copy of the type stream for C-speed scans in
+        # synchronize().
+        self._type_bytes = bytes(self.types)
+        # Packrat memo table; None means memoization is disabled (the default).
+        self._memo = {} if memoize else None
     
     def error(self, message: str) -> None:
         """Raise a parse error with current token location."""
         raise ParseError(message, self.current_token)
     
     def advance(self) -> Token:
-        """Move to next token and return current token."""
-        if self.current < len(self.tokens) - 1:
+        """Move to next token and return current token.
+
+        The EOF sentinel appended in __init__ makes the cursor self-limiting:
+        no len() bounds check per step, just one type compare.
+        """
+        if self.current_token.type != _TT_EOF:
             self.current += 1
             self.current_token = self.tokens[self.current]
         return self.current_token
@@ -351,12 +466,16 @@ class Parser:
         """Look ahead at token without advancing position."""
         peek_pos = self.current + offset
         if peek_pos >= len(self.tokens):
-            return Token(TokenType.EOF, "", 0, 0)
+            return self.tokens[-1]  # EOF sentinel, guaranteed by __init__
         return self.tokens[peek_pos]
     
     def match(self, *token_types: TokenType) -> bool:
         """Check if current token matches any of the given types."""
-        return self.current_token.type in token_types
+        return self.types[self.current] in token_types
+
+    def match_mask(self, mask: int) -> bool:
+        """Check if current token's type bit is set in a precomputed mask."""
+        return (mask >> self.types[self.current]) & 1 != 0
     
     def consume(self, token_type: TokenType, error_message: str = None) -> Token:
         """Consume token of expected type or raise error."""
@@ -371,18 +490,31 @@ class Parser:
     
     def synchronize(self) -> None:
         """Recover from parse error by finding next statement boundary."""
-        self.advance()
-        
-        while not self.match(TokenType.EOF):
-            if self.tokens[self.current - 1].type == TokenType.SEMICOLON:
-                return
-            
-            if self.match(TokenType.IF, TokenType.FOR, TokenType.WHILE, 
-                         TokenType.RETURN, TokenType.INT, TokenType.FLOAT_KW,
-                         TokenType.CHAR_KW, TokenType.VOID):
-                return
-            
-            self.advance()
+        # Two C-level scans over the byte-encoded type stream replace the
+        # old per-token Python loop, which could cover a lot of tokens on
+        # badly broken input: stop just past the nearest semicolon or at the
+        # nearest statement/declaration keyword, whichever comes first.
+        tokens = self.tokens
+        limit = len(tokens) - 1
+        start = min(self.current + 1, limit)
+        type_bytes = self._type_bytes
+
+        pos = limit
+        semi = type_bytes.find(_SEMICOLON_BYTE, start - 1)
+        if semi != -1 and semi + 1 < pos:
+            pos = semi + 1
+        keyword = _SYNC_SCAN_RE.search(type_bytes, start)
+        if keyword is not None and keyword.start() < pos:
+            pos = keyword.start()
+
+        self.current = pos
+        self.current_token = tokens[pos]
+
+        # Results cached mid-way through a failed construct may describe a
+        # parse the recovery just abandoned; drop them rather than risk
+        # serving one after the cursor jump.
+        if self._memo:
+            self._memo.clear()
     
     # ========================================================================
     # PARSING METHODS
@@ -391,31 +523,36 @@ class Parser:
     def parse(self) -> Program:
         """Parse the entire program and return AST root."""
         declarations = []
-        
+        # Bind the per-iteration callables once; the loop body then skips
+        # the method-descriptor lookups entirely.
+        append = declarations.append
+        parse_declaration = self.parse_declaration
+        types = self.types
+
         try:
-            while not self.match(TokenType.EOF):
+            while types[self.current] != _TT_EOF:
                 try:
-                    decl = self.parse_declaration()
+                    decl = parse_declaration()
                     if decl:
-                        declarations.append(decl)
+                        append(decl)
                 except ParseError as e:
                     print(f"Parse Error: {e}")
                     self.synchronize()
-            
+
             return Program(declarations)
-        
+
         except Exception as e:
             print(f"Fatal Parse Error: {e}")
             return Program([])
     
+    @memoize
     def parse_declaration(self) -> Optional[ASTNode]:
         """Parse top-level declaration (function or variable)."""
         # Skip EOF tokens
         if self.match(TokenType.EOF):
             return None
         
-        if not self.match(TokenType.INT, TokenType.FLOAT_KW, TokenType.CHAR_KW, 
-                          TokenType.VOID, TokenType.DOUBLE):
+        if not self.match_mask(_TYPE_START_MASK):
             self.error("Expected type declaration")
         
         # Parse type
@@ -442,7 +579,7 @@ class Parser:
         self.consume(TokenType.LEFT_PAREN, "Expected '(' after function name")
         
         # Parse parameters
-        parameters = []
+        parameters = ()
         if not self.match(TokenType.RIGHT_PAREN):
             parameters = self.parse_parameter_list()
         
@@ -457,26 +594,29 @@ class Parser:
         
         return FunctionDeclaration(return_type, name, parameters, body)
     
-    def parse_parameter_list(self) -> List[Parameter]:
+    def parse_parameter_list(self) -> Tuple[Parameter, ...]:
         """Parse function parameter list."""
         parameters = []
-        
+
         # First parameter
         param = self.parse_parameter()
         parameters.append(param)
-        
-        # Additional parameters
-        while self.match(TokenType.COMMA):
+
+        # Additional parameters; compare against the flat type array rather
+        # than re-reading the token attribute chain each iteration.
+        types = self.types
+        while types[self.current] == _TT_COMMA:
             self.advance()  # consume comma
             param = self.parse_parameter()
             parameters.append(param)
-        
-        return parameters
+
+        # Parameters are immutable once parsed; a tuple is smaller than a
+        # list and signals that downstream passes must not mutate it.
+        return tuple(parameters)
     
     def parse_parameter(self) -> Parameter:
         """Parse single function parameter."""
-        if not self.match(TokenType.INT, TokenType.FLOAT_KW, TokenType.CHAR_KW, 
-                          TokenType.VOID, TokenType.DOUBLE):
+        if not self.match_mask(_TYPE_START_MASK):
             self.error("Expected parameter type")
         
         param_type = self.current_token.value
@@ -498,7 +638,11 @@ class Parser:
             self.advance()  # consume '='
             initializer = self.parse_expression()
         
-        self.consume(TokenType.SEMICOLON, "Expected ';' after variable declaration")
+        # Hot consume site, inlined: one type compare on the happy path.
+        if self.current_token.type == _TT_SEMICOLON:
+            self.advance()
+        else:
+            self.error("Expected ';' after variable declaration")
         return VariableDeclaration(type_name, name, initializer)
     
     # ========================================================================
@@ -510,53 +654,57 @@ class Parser:
         self.consume(TokenType.LEFT_BRACE, "Expected '{'")
         
         statements = []
-        while not self.match(TokenType.RIGHT_BRACE) and not self.match(TokenType.EOF):
-            stmt = self.parse_statement()
+        # Loop-carried names bound once per block, not per statement.
+        append = statements.append
+        parse_statement = self.parse_statement
+        types = self.types
+        tt_right_brace = TokenType.RIGHT_BRACE
+
+        while True:
+            token_type = types[self.current]
+            if token_type == tt_right_brace or token_type == _TT_EOF:
+                break
+            # Recovery lives here, once per statement boundary, so
+            # parse_statement itself runs without a try-block on the happy
+            # path.
+            try:
+                stmt = parse_statement()
+            except ParseError as e:
+                print(f"Statement Parse Error: {e}")
+                self.synchronize()
+                continue
             if stmt:
-                statements.append(stmt)
-        
+                append(stmt)
+
         self.consume(TokenType.RIGHT_BRACE, "Expected '}'")
         return CompoundStatement(statements)
     
     def parse_statement(self) -> Optional[ASTNode]:
-        """Parse any kind of statement."""
-        try:
-            if self.match(TokenType.LEFT_BRACE):
-                return self.parse_compound_statement()
-            
-            elif self.match(TokenType.RETURN):
-                return self.parse_return_statement()
-            
-            elif self.match(TokenType.IF):
-                return self.parse_if_statement()
-            
-            elif self.match(TokenType.WHILE):
-                return self.parse_while_statement()
-            
-            elif self.match(TokenType.FOR):
-                return self.parse_for_statement()
-            
-            elif self.match(TokenType.INT, TokenType.FLOAT_KW, TokenType.CHAR_KW, 
-                           TokenType.VOID, TokenType.DOUBLE):
-                # Variable declaration in statement context
-                type_name = self.current_token.value
-                self.advance()
-                
-                if not self.match(TokenType.IDENTIFIER):
-                    self.error("Expected identifier")
-                
-                name = self.current_token.value
-                self.advance()
-                
-                return self.parse_variable_declaration(type_name, name)
-            
-            else:
-                return self.parse_expression_statement()
-        
-        except ParseError as e:
-            print(f"Statement Parse Error: {e}")
-            self.synchronize()
-            return None
+        """Parse any kind of statement.
+
+        Dispatches through a token-type-keyed table (statements not starting
+        with a recognized keyword/type fall through to expression
+        statements). ParseErrors propagate to the caller; recovery happens
+        at statement boundaries in parse_compound_statement and at
+        declaration boundaries in parse.
+        """
+        handler = self._STMT_DISPATCH.get(self.types[self.current])
+        if handler is None:
+            return self.parse_expression_statement()
+        return handler(self)
+
+    def _parse_declaration_statement(self) -> VariableDeclaration:
+        """Parse a variable declaration in statement context."""
+        type_name = self.current_token.value
+        self.advance()
+
+        if not self.match(TokenType.IDENTIFIER):
+            self.error("Expected identifier")
+
+        name = self.current_token.value
+        self.advance()
+
+        return self.parse_variable_declaration(type_name, name)
     
     def parse_return_statement(self) -> ReturnStatement:
         """Parse return statement."""
@@ -566,7 +714,10 @@ class Parser:
         if not self.match(TokenType.SEMICOLON):
             expression = self.parse_expression()
         
-        self.consume(TokenType.SEMICOLON, "Expected ';' after return statement")
+        if self.current_token.type == _TT_SEMICOLON:
+            self.advance()
+        else:
+            self.error("Expected ';' after return statement")
         return ReturnStatement(expression)
     
     def parse_if_statement(self) -> IfStatement:
@@ -634,201 +785,247 @@ class Parser:
         if not self.match(TokenType.SEMICOLON):
             expression = self.parse_expression()
         
-        self.consume(TokenType.SEMICOLON, "Expected ';' after expression")
+        if self.current_token.type == _TT_SEMICOLON:
+            self.advance()
+        else:
+            self.error("Expected ';' after expression")
         return ExpressionStatement(expression)
+
+    # Statement dispatch: maps a statement's first token type to its parse
+    # method; declaration-starting type keywords all route to the variable
+    # declaration handler.
+    _STMT_DISPATCH = {
+        TokenType.LEFT_BRACE: parse_compound_statement,
+        TokenType.RETURN: parse_return_statement,
+        TokenType.IF: parse_if_statement,
+        TokenType.WHILE: parse_while_statement,
+        TokenType.FOR: parse_for_statement,
+        TokenType.INT: _parse_declaration_statement,
+        TokenType.FLOAT_KW: _parse_declaration_statement,
+        TokenType.CHAR_KW: _parse_declaration_statement,
+        TokenType.VOID: _parse_declaration_statement,
+        TokenType.DOUBLE: _parse_declaration_statement,
+    }
     
     # ========================================================================
     # EXPRESSION PARSING (with operator precedence)
     # ========================================================================
     
+    @memoize
     def parse_expression(self) -> ASTNode:
         """Parse expression (top level)."""
         return self.parse_assignment()
     
     def parse_assignment(self) -> ASTNode:
-        """Parse assignment expression (right associative)."""
-        expr = self.parse_logical_or()
-        
-        if self.match(TokenType.ASSIGN, TokenType.PLUS_ASSIGN, TokenType.MINUS_ASSIGN,
-                      TokenType.MULT_ASSIGN, TokenType.DIV_ASSIGN, TokenType.MOD_ASSIGN):
-            operator = self.current_token.value
-            self.advance()
-            right = self.parse_assignment()  # Right associative
-            return AssignmentExpression(expr, operator, right)
-        
-        return expr
-    
-    def parse_logical_or(self) -> ASTNode:
-        """Parse logical OR expression."""
-        expr = self.parse_logical_and()
-        
-        while self.match(TokenType.LOGICAL_OR):
-            operator = self.current_token.value
-            self.advance()
-            right = self.parse_logical_and()
-            expr = BinaryExpression(expr, operator, right)
-        
-        return expr
-    
-    def parse_logical_and(self) -> ASTNode:
-        """Parse logical AND expression."""
-        expr = self.parse_equality()
-        
-        while self.match(TokenType.LOGICAL_AND):
-            operator = self.current_token.value
-            self.advance()
-            right = self.parse_equality()
-            expr = BinaryExpression(expr, operator, right)
-        
-        return expr
-    
-    def parse_equality(self) -> ASTNode:
-        """Parse equality expression."""
-        expr = self.parse_relational()
-        
-        while self.match(TokenType.EQUAL, TokenType.NOT_EQUAL):
-            operator = self.current_token.value
-            self.advance()
-            right = self.parse_relational()
-            expr = BinaryExpression(expr, operator, right)
-        
-        return expr
-    
-    def parse_relational(self) -> ASTNode:
-        """Parse relational expression."""
-        expr = self.parse_additive()
-        
-        while self.match(TokenType.LESS_THAN, TokenType.GREATER_THAN,
-                         TokenType.LESS_EQUAL, TokenType.GREATER_EQUAL):
-            operator = self.current_token.value
-            self.advance()
-            right = self.parse_additive()
-            expr = BinaryExpression(expr, operator, right)
-        
-        return expr
-    
-    def parse_additive(self) -> ASTNode:
-        """Parse additive expression."""
-        expr = self.parse_multiplicative()
-        
-        while self.match(TokenType.PLUS, TokenType.MINUS):
+        """Parse assignment expression (right associative).
+
+        Chains like a = b = c are parsed iteratively: targets and operators
+        are collected left to right, then folded right-associatively, so the
+        chain costs one frame instead of one recursive call per '='.
+        """
+        expr = self.parse_binary()
+
+        if not self.match_mask(_ASSIGN_OP_MASK):
+            return expr
+
+        pairs = []
+        while self.match_mask(_ASSIGN_OP_MASK):
             operator = self.current_token.value
             self.advance()
-            right = self.parse_multiplicative()
-            expr = BinaryExpression(expr, operator, right)
-        
+            pairs.append((expr, operator))
+            expr = self.parse_binary()
+
+        for target, operator in reversed(pairs):
+            expr = AssignmentExpression(target, operator, expr)
         return expr
     
-    def parse_multiplicative(self) -> ASTNode:
-        """Parse multiplicative expression."""
+    def parse_binary(self, min_precedence: int = 1) -> ASTNode:
+        """Parse left-associative binary operators by precedence climbing.
+
+        One loop with a precedence table replaces the six-level cascade
+        (logical_or .. multiplicative): an operand like a bare identifier
+        costs a single dict probe instead of six nested calls, and the tree
+        produced is identical to the old cascade's.
+        """
         expr = self.parse_unary()
-        
-        while self.match(TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.MODULO):
-            operator = self.current_token.value
-            self.advance()
-            right = self.parse_unary()
+        # Hoist hot lookups out of the loop: each iteration then costs one
+        # attribute read for the cursor plus a dict probe, instead of
+        # re-resolving globals and bound methods every time around.
+        get_precedence = _BINARY_PRECEDENCE.get
+        advance = self.advance
+        parse_binary = self.parse_binary
+        types = self.types
+        values = self.values
+
+        while True:
+            pos = self.current
+            precedence = get_precedence(types[pos])
+            if precedence is None or precedence < min_precedence:
+                return expr
+            operator = values[pos]
+            advance()
+            # Left associativity: the right operand only claims strictly
+            # tighter-binding operators.
+            right = parse_binary(precedence + 1)
             expr = BinaryExpression(expr, operator, right)
-        
-        return expr
-    
+
+    @memoize
     def parse_unary(self) -> ASTNode:
-        """Parse unary expression."""
-        if self.match(TokenType.LOGICAL_NOT, TokenType.MINUS, 
-                      TokenType.INCREMENT, TokenType.DECREMENT):
-            operator = self.current_token.value
+        """Parse unary expression.
+
+        Prefix operators are collected iteratively and folded over the
+        operand innermost-first, avoiding one recursive call per operator
+        (and the list allocation entirely when there is no prefix at all).
+        """
+        if not self.match_mask(_UNARY_OP_MASK):
+            return self.parse_postfix()
+
+        operators = []
+        types = self.types
+        values = self.values
+        while (_UNARY_OP_MASK >> types[self.current]) & 1:
+            operators.append(values[self.current])
             self.advance()
-            expr = self.parse_unary()
-            return UnaryExpression(operator, expr)
-        
-        return self.parse_postfix()
+
+        expr = self.parse_postfix()
+        for operator in reversed(operators):
+            expr = UnaryExpression(operator, expr)
+        return expr
     
     def parse_postfix(self) -> ASTNode:
         """Parse postfix expression."""
         expr = self.parse_primary()
-        
+        advance = self.advance
+        incdec_mask = _INCDEC_MASK
+        tt_left_paren = TokenType.LEFT_PAREN
+
         while True:
-            if self.match(TokenType.LEFT_PAREN):
+            token = self.current_token
+            if token.type == tt_left_paren:
                 # Function call
-                self.advance()  # consume '('
-                arguments = []
-                
+                advance()  # consume '('
+                arguments = ()
+
                 if not self.match(TokenType.RIGHT_PAREN):
                     arguments = self.parse_argument_list()
-                
-                self.consume(TokenType.RIGHT_PAREN, "Expected ')' after arguments")
+
+                if self.current_token.type == _TT_RIGHT_PAREN:
+                    advance()
+                else:
+                    self.error("Expected ')' after arguments")
                 expr = CallExpression(expr, arguments)
-            
-            elif self.match(TokenType.INCREMENT, TokenType.DECREMENT):
+
+            elif (incdec_mask >> token.type) & 1:
                 # Postfix increment/decrement
-                operator = self.current_token.value
-                self.advance()
-                expr = UnaryExpression(f"post{operator}", expr)
-            
+                operator = token.value
+                advance()
+                expr = UnaryExpression(sys.intern(f"post{operator}"), expr)
+
             else:
                 break
-        
+
         return expr
     
-    def parse_argument_list(self) -> List[ASTNode]:
+    def parse_argument_list(self) -> Tuple[ASTNode, ...]:
         """Parse function call arguments."""
         arguments = []
-        
+
         # First argument
-        arguments.append(self.parse_expression())
-        
-        # Additional arguments
-        while self.match(TokenType.COMMA):
+        append = arguments.append
+        parse_expression = self.parse_expression
+        append(parse_expression())
+
+        # Additional arguments; same flat-array compare as the parameter loop.
+        types = self.types
+        while types[self.current] == _TT_COMMA:
             self.advance()  # consume comma
-            arguments.append(self.parse_expression())
-        
-        return arguments
+            append(parse_expression())
+
+        return tuple(arguments)
     
+    def _parse_identifier_primary(self) -> Identifier:
+        name = self.current_token.value
+        self.advance()
+        return Identifier(name)
+
+    def _parse_integer_primary(self) -> IntegerLiteral:
+        value = self.current_token.value
+        if type(value) is not int:  # lexer converts eagerly; fall back for str
+            value = int(value)
+        self.advance()
+        return IntegerLiteral(value)
+
+    def _parse_float_primary(self) -> FloatLiteral:
+        value = self.current_token.value
+        if type(value) is not float:  # lexer converts eagerly; fall back for str
+            value = float(value)
+        self.advance()
+        return FloatLiteral(value)
+
+    def _parse_string_primary(self) -> StringLiteral:
+        value = self.current_token.value
+        self.advance()
+        return StringLiteral(value)
+
+    def _parse_char_primary(self) -> CharLiteral:
+        value = self.current_token.value
+        self.advance()
+        return CharLiteral(value)
+
+    def _parse_paren_primary(self) -> ASTNode:
+        self.advance()  # consume '('
+        expr = self.parse_expression()
+        if self.current_token.type == _TT_RIGHT_PAREN:
+            self.advance()
+        else:
+            self.error("Expected ')' after expression")
+        return expr
+
+    # Primary-expression dispatch: one dict probe on the token type replaces
+    # the old six-way if/elif chain.
+    _PRIMARY_DISPATCH = {
+        TokenType.IDENTIFIER: _parse_identifier_primary,
+        TokenType.INTEGER: _parse_integer_primary,
+        TokenType.FLOAT: _parse_float_primary,
+        TokenType.STRING: _parse_string_primary,
+        TokenType.CHAR: _parse_char_primary,
+        TokenType.LEFT_PAREN: _parse_paren_primary,
+    }
+
     def parse_primary(self) -> ASTNode:
         """Parse primary expression."""
-        if self.match(TokenType.IDENTIFIER):
-            name = self.current_token.value
+        # Identifiers and integers dominate real code; handle them without
+        # the dict probe.
+        tt = self.types[self.current]
+        if tt == _TT_IDENTIFIER:
+            name = self.values[self.current]
             self.advance()
             return Identifier(name)
-        
-        elif self.match(TokenType.INTEGER):
-            value = int(self.current_token.value)
+        if tt == _TT_INTEGER:
+            value = self.values[self.current]
+            if type(value) is not int:  # lexer converts eagerly; fall back for str
+                value = int(value)
             self.advance()
             return IntegerLiteral(value)
-        
-        elif self.match(TokenType.FLOAT):
-            value = float(self.current_token.value)
-            self.advance()
-            return FloatLiteral(value)
-        
-        elif self.match(TokenType.STRING):
-            value = self.current_token.value
-            self.advance()
-            return StringLiteral(value)
-        
-        elif self.match(TokenType.CHAR):
-            value = self.current_token.value
-            self.advance()
-            return CharLiteral(value)
-        
-        elif self.match(TokenType.LEFT_PAREN):
-            self.advance()  # consume '('
-            expr = self.parse_expression()
-            self.consume(TokenType.RIGHT_PAREN, "Expected ')' after expression")
-            return expr
-        
-        else:
+        handler = self._PRIMARY_DISPATCH.get(tt)
+        if handler is None:
             self.error(f"Unexpected token: {self.current_token.type.name}")
+        return handler(self)
 
 # ============================================================================
 # SYMBOL TABLE AND TYPE SYSTEM
 # ============================================================================
 
+# Type names that participate in numeric promotion.
+_NUMERIC_TYPE_NAMES = frozenset({'int', 'float', 'double', 'char'})
+
 class CType:
     """Represents a C type with size and properties."""
     def __init__(self, name: str, size: int, is_signed: bool = True):
         self.name = name
         self.size = size  # Size in bytes
         self.is_signed = is_signed
+        self.is_numeric = name in _NUMERIC_TYPE_NAMES
     
     def __str__(self):
         return self.name
@@ -845,11 +1042,7 @@ class CType:
             return True
         
         # Numeric types can be promoted
-        numeric_types = {'int', 'float', 'double', 'char'}
-        if self.name in numeric_types and other.name in numeric_types:
-            return True
-        
-        return False
+        return self.is_numeric and other.is_numeric
     
     def can_assign_from(self, other: 'CType') -> bool:
         """Check if we can assign from other type to this type."""
@@ -864,7 +1057,13 @@ BUILTIN_TYPES = {
     'double': CType('double', 8, True),
 }
 
-@dataclass
+# The analyzer hands these out constantly as expression result types; bind
+# them once so hot paths skip the BUILTIN_TYPES hash per node.
+INT_TYPE = BUILTIN_TYPES['int']
+FLOAT_TYPE = BUILTIN_TYPES['float']
+CHAR_TYPE = BUILTIN_TYPES['char']
+
+@dataclass(slots=True)
 class Symbol:
     """Represents a symbol in the symbol table."""
     name: str
@@ -877,54 +1076,79 @@ class Symbol:
 
 class FunctionSymbol(Symbol):
     """Represents a function symbol with parameters and return type."""
-    
-    def __init__(self, name: str, return_type: CType, parameters: List[CType], 
+
+    __slots__ = ('parameters',)
+
+    def __init__(self, name: str, return_type: CType, parameters: List[CType],
                  scope_level: int, is_defined: bool = False, line: int = 0, column: int = 0):
         super().__init__(name, return_type, 'function', scope_level, is_defined, line, column)
-        self.return_type = return_type
         self.parameters = parameters
 
+    @property
+    def return_type(self) -> CType:
+        """The function's return type (alias for symbol_type)."""
+        return self.symbol_type
+
 class SymbolTable:
     """Symbol table with scope management."""
     
     def __init__(self):
         self.scopes = [{}]  # Stack of scopes (list of dictionaries)
         self.current_scope_level = 0
-        
+        # Resolved name->Symbol results; repeated lookups of the same name
+        # (loop variables, call arguments) skip the scope-chain walk. Cleared
+        # whenever a declaration or scope exit could change resolution.
+        self._lookup_cache = {}
+
     def enter_scope(self):
         """Enter a new scope."""
+        # Scope dicts are created lazily on first declaration; most block
+        # scopes never declare anything.
         self.current_scope_level += 1
-        self.scopes.append({})
+        self.scopes.append(None)
     
     def exit_scope(self):
         """Exit current scope."""
         if self.current_scope_level > 0:
             self.scopes.pop()
             self.current_scope_level -= 1
+            self._lookup_cache.clear()
     
     def declare_symbol(self, symbol: Symbol) -> bool:
         """Declare a symbol in current scope. Returns True if successful."""
-        current_scope = self.scopes[self.current_scope_level]
-        
+        current_scope = self.scopes[-1]
+        if current_scope is None:
+            current_scope = self.scopes[-1] = {}
+
         if symbol.name in current_scope:
             return False  # Already declared in this scope
-        
+
         symbol.scope_level = self.current_scope_level
         current_scope[symbol.name] = symbol
+        self._lookup_cache.clear()  # the new symbol may shadow a cached one
         return True
-    
+
     def lookup_symbol(self, name: str) -> Optional[Symbol]:
         """Look up symbol in all scopes (from current to global)."""
-        for scope_level in range(self.current_scope_level, -1, -1):
-            scope = self.scopes[scope_level]
-            if name in scope:
-                return scope[name]
+        cache = self._lookup_cache
+        symbol = cache.get(name)
+        if symbol is not None:
+            return symbol
+        # Chained-dict walk, innermost first: one .get per scope with a
+        # C-level reversed iterator instead of index arithmetic per level.
+        for scope in reversed(self.scopes):
+            if scope is None:
+                continue
+            symbol = scope.get(name)
+            if symbol is not None:
+                cache[name] = symbol
+                return symbol
         return None
-    
+
     def lookup_in_current_scope(self, name: str) -> Optional[Symbol]:
         """Look up symbol only in current scope."""
-        current_scope = self.scopes[self.current_scope_level]
-        return current_scope.get(name)
+        scope = self.scopes[-1]
+        return scope.get(name) if scope is not None else None
 
 class SemanticError(Exception):
     """Exception raised during semantic analysis."""
@@ -954,6 +1178,9 @@ class SemanticAnalyzer:
         self.symbol_table = SymbolTable()
         self.current_function = None  # Track current function for return checking
         self.errors = []
+        # Result types of composite expression nodes, keyed by node identity.
+        # Identifiers are excluded: their type depends on the enclosing scope.
+        self._expr_type_cache = {}
         
         # Add built-in functions
         self._add_builtin_functions()
@@ -962,19 +1189,33 @@ class SemanticAnalyzer:
         """Add built-in C functions to symbol table."""
         # printf function
         printf_symbol = FunctionSymbol(
-            'printf', 
-            BUILTIN_TYPES['int'], 
-            [BUILTIN_TYPES['char']],  # Format string (simplified)
-            0, 
+            'printf',
+            INT_TYPE,
+            [CHAR_TYPE],  # Format string (simplified)
+            0,
             True
         )
         self.symbol_table.declare_symbol(printf_symbol)
     
     def error(self, message: str, line: int = 0, column: int = 0):
         """Record semantic error."""
-        error = SemanticError(message, line, column)
-        self.errors.append(error)
-        print(f"Semantic Error: {message} at line {line}, column {column}")
+        # Diagnostics are buffered and flushed once at the end of analyze();
+        # printing per error flushes stdout for every diagnostic on
+        # error-heavy inputs.
+        self.errors.append(SemanticError(message, line, column))
+
+    @staticmethod
+    def _resolve_type(type_name: str, node: ASTNode) -> Optional[CType]:
+        """Resolve a declared type name, caching the result on the node.
+
+        The two-pass analysis revisits the same declarations; after the
+        first resolution the CType rides along on the node's ctype field.
+        """
+        ctype = node.ctype
+        if ctype is None:
+            ctype = BUILTIN_TYPES.get(type_name)
+            node.ctype = ctype
+        return ctype
     
     def analyze(self, ast: Program) -> bool:
         """Analyze the entire program. Returns True if no errors."""
@@ -984,38 +1225,48 @@ class SemanticAnalyzer:
         except Exception as e:
             self.error(f"Fatal semantic analysis error: {e}")
             return False
+        finally:
+            if self.errors:
+                sys.stdout.write('\n'.join(str(e) for e in self.errors) + '\n')
     
     def visit_program(self, node: Program):
         """Visit program root node."""
         print("🔍 Analyzing program structure...")
         
-        # First pass: Declare all functions and global variables
+        # Single walk: declare everything, deferring bodies so functions can
+        # call ones declared later, and count declarations along the way.
+        function_count = 0
+        variable_count = 0
+        pending_bodies = []
         for declaration in node.declarations:
             if isinstance(declaration, FunctionDeclaration):
+                function_count += 1
                 self._declare_function(declaration)
+                if declaration.body:
+                    pending_bodies.append(declaration)
             elif isinstance(declaration, VariableDeclaration):
+                variable_count += 1
                 self._declare_global_variable(declaration)
-        
-        # Second pass: Analyze function bodies
-        for declaration in node.declarations:
-            if isinstance(declaration, FunctionDeclaration) and declaration.body:
-                self.visit_function_declaration(declaration)
-        
-        print(f"   Found {len([d for d in node.declarations if isinstance(d, FunctionDeclaration)])} functions")
-        print(f"   Found {len([d for d in node.declarations if isinstance(d, VariableDeclaration)])} global variables")
+
+        # Analyze function bodies now that every signature is known
+        for declaration in pending_bodies:
+            self.visit_function_declaration(declaration)
+
+        print(f"   Found {function_count} functions")
+        print(f"   Found {variable_count} global variables")
     
     def _declare_function(self, node: FunctionDeclaration):
         """Declare function in symbol table."""
         # Get return type
-        return_type = BUILTIN_TYPES.get(node.return_type)
+        return_type = self._resolve_type(node.return_type, node)
         if not return_type:
             self.error(f"Unknown return type: {node.return_type}")
             return
-        
+
         # Get parameter types
         param_types = []
         for param in node.parameters:
-            param_type = BUILTIN_TYPES.get(param.type)
+            param_type = self._resolve_type(param.type, param)
             if not param_type:
                 self.error(f"Unknown parameter type: {param.type}")
                 continue
@@ -1035,7 +1286,7 @@ class SemanticAnalyzer:
     
     def _declare_global_variable(self, node: VariableDeclaration):
         """Declare global variable in symbol table."""
-        var_type = BUILTIN_TYPES.get(node.type)
+        var_type = self._resolve_type(node.type, node)
         if not var_type:
             self.error(f"Unknown variable type: {node.type}")
             return
@@ -1068,9 +1319,10 @@ class SemanticAnalyzer:
         # Enter function scope
         self.symbol_table.enter_scope()
         
-        # Declare parameters in function scope
+        # Declare parameters in function scope; _declare_function already
+        # resolved these in pass 1, so this is a field read per parameter.
         for param in node.parameters:
-            param_type = BUILTIN_TYPES.get(param.type)
+            param_type = self._resolve_type(param.type, param)
             if param_type:
                 param_symbol = Symbol(param.name, param_type, 'parameter', 
                                     self.symbol_table.current_scope_level, True)
@@ -1096,25 +1348,18 @@ class SemanticAnalyzer:
     
     def visit_statement(self, node: ASTNode):
         """Visit any statement."""
-        if isinstance(node, VariableDeclaration):
-            self.visit_variable_declaration(node)
-        elif isinstance(node, ExpressionStatement):
-            if node.expression:
-                self.visit_expression(node.expression)
-        elif isinstance(node, ReturnStatement):
-            self.visit_return_statement(node)
-        elif isinstance(node, IfStatement):
-            self.visit_if_statement(node)
-        elif isinstance(node, WhileStatement):
-            self.visit_while_statement(node)
-        elif isinstance(node, ForStatement):
-            self.visit_for_statement(node)
-        elif isinstance(node, CompoundStatement):
-            self.visit_compound_statement(node)
+        handler = self._STMT_DISPATCH.get(type(node))
+        if handler is not None:
+            handler(self, node)
+
+    def _visit_expression_statement(self, node: ExpressionStatement):
+        """Visit expression statement."""
+        if node.expression:
+            self.visit_expression(node.expression)
     
     def visit_variable_declaration(self, node: VariableDeclaration):
         """Visit variable declaration."""
-        var_type = BUILTIN_TYPES.get(node.type)
+        var_type = self._resolve_type(node.type, node)
         if not var_type:
             self.error(f"Unknown variable type: {node.type}")
             return
@@ -1190,40 +1435,37 @@ class SemanticAnalyzer:
         # Visit body
         self.visit_statement(node.body)
     
+    def _visit_identifier(self, node: Identifier) -> Optional[CType]:
+        """Look up an identifier's declared type."""
+        symbol = self.symbol_table.lookup_symbol(node.name)
+        if not symbol:
+            self.error(f"Undefined variable: {node.name}")
+            return None
+        return symbol.symbol_type
+
     def visit_expression(self, node: ASTNode) -> Optional[CType]:
         """Visit expression and return its type."""
-        if isinstance(node, IntegerLiteral):
-            return BUILTIN_TYPES['int']
-        
-        elif isinstance(node, FloatLiteral):
-            return BUILTIN_TYPES['float']
-        
-        elif isinstance(node, StringLiteral):
-            return BUILTIN_TYPES['char']  # char* in reality
-        
-        elif isinstance(node, CharLiteral):
-            return BUILTIN_TYPES['char']
-        
-        elif isinstance(node, Identifier):
-            symbol = self.symbol_table.lookup_symbol(node.name)
-            if not symbol:
-                self.error(f"Undefined variable: {node.name}")
-                return None
-            return symbol.symbol_type
-        
-        elif isinstance(node, BinaryExpression):
-            return self.visit_binary_expression(node)
-        
-        elif isinstance(node, UnaryExpression):
-            return self.visit_unary_expression(node)
-        
-        elif isinstance(node, AssignmentExpression):
-            return self.visit_assignment_expression(node)
-        
-        elif isinstance(node, CallExpression):
-            return self.visit_call_expression(node)
-        
-        return None
+        # Literals and identifiers resolve directly; one dict probe on the
+        # concrete type replaces the old isinstance ladder.
+        node_type = type(node)
+        handler = self._EXPR_DISPATCH.get(node_type)
+        if handler is not None:
+            return handler(self, node)
+
+        handler = self._COMPOSITE_EXPR_DISPATCH.get(node_type)
+        if handler is None:
+            return None
+
+        # Composite nodes are memoized on identity so a subtree reached
+        # through several paths is only typed (and diagnosed) once.
+        key = id(node)
+        cache = self._expr_type_cache
+        if key in cache:
+            return cache[key]
+
+        result = handler(self, node)
+        cache[key] = result
+        return result
     
     def visit_binary_expression(self, node: BinaryExpression) -> Optional[CType]:
         """Visit binary expression and return result type."""
@@ -1237,9 +1479,10 @@ class SemanticAnalyzer:
         if node.operator in ['+', '-', '*', '/', '%']:
             if left_type.is_compatible_with(right_type):
                 # Type promotion: if either is float, result is float
-                if left_type.name == 'float' or right_type.name == 'float':
-                    return BUILTIN_TYPES['float']
-                return BUILTIN_TYPES['int']
+                # (identity compare is safe: BUILTIN_TYPES are singletons)
+                if left_type is FLOAT_TYPE or right_type is FLOAT_TYPE:
+                    return FLOAT_TYPE
+                return INT_TYPE
             else:
                 self.error(f"Cannot perform {node.operator} on {left_type} and {right_type}")
                 return None
@@ -1247,14 +1490,14 @@ class SemanticAnalyzer:
         # Comparison operators
         elif node.operator in ['<', '>', '<=', '>=', '==', '!=']:
             if left_type.is_compatible_with(right_type):
-                return BUILTIN_TYPES['int']  # Boolean result as int
+                return INT_TYPE  # Boolean result as int
             else:
                 self.error(f"Cannot compare {left_type} and {right_type}")
                 return None
-        
+
         # Logical operators
         elif node.operator in ['&&', '||']:
-            return BUILTIN_TYPES['int']  # Boolean result as int
+            return INT_TYPE  # Boolean result as int
         
         return None
     
@@ -1322,6 +1565,35 @@ class SemanticAnalyzer:
         
         return func_symbol.return_type
 
+    # Statement and expression dispatch: one dict probe on the concrete node
+    # type replaces the isinstance ladders. Values are plain functions,
+    # invoked as handler(self, node).
+    _STMT_DISPATCH = {
+        VariableDeclaration: visit_variable_declaration,
+        ExpressionStatement: _visit_expression_statement,
+        ReturnStatement: visit_return_statement,
+        IfStatement: visit_if_statement,
+        WhileStatement: visit_while_statement,
+        ForStatement: visit_for_statement,
+        CompoundStatement: visit_compound_statement,
+    }
+
+    _EXPR_DISPATCH = {
+        IntegerLiteral: lambda self, node: INT_TYPE,
+        FloatLiteral: lambda self, node: FLOAT_TYPE,
+        StringLiteral: lambda self, node: CHAR_TYPE,  # char* in reality
+        CharLiteral: lambda self, node: CHAR_TYPE,
+        Identifier: _visit_identifier,
+    }
+
+    # Results of these go through the id()-keyed type cache.
+    _COMPOSITE_EXPR_DISPATCH = {
+        BinaryExpression: visit_binary_expression,
+        UnaryExpression: visit_unary_expression,
+        AssignmentExpression: visit_assignment_expression,
+        CallExpression: visit_call_expression,
+    }
+
 # ============================================================================
 # CODE GENERATOR (x86-64 ASSEMBLY)
 # ============================================================================
@@ -4042,243 +4314,273 @@ class AdvancedRegisterAllocator:
 # LEXICAL ANALYZER (TOKENIZER)
 # ============================================================================
 
+# C Keywords
+KEYWORDS = frozenset({
+    'auto', 'break', 'case', 'char', 'const', 'continue', 'default', 'do',
+    'double', 'else', 'enum', 'extern', 'float', 'for', 'goto', 'if',
+    'int', 'long', 'register', 'return', 'short', 'signed', 'sizeof',
+    'static', 'struct', 'switch', 'typedef', 'union', 'unsigned', 'void',
+    'volatile', 'while'
+})
+
+def _keyword_token_type(keyword: str) -> TokenType:
+    """Map a keyword string to its TokenType member (handles CHAR_KW/FLOAT_KW)."""
+    token_type = getattr(TokenType, keyword.upper(), None)
+    if token_type is None:
+        token_type = getattr(TokenType, keyword.upper() + '_KW', TokenType.IDENTIFIER)
+    return token_type
+
+# Keyword and operator dispatch tables (text -> TokenType)
+KEYWORD_TT = {kw: _keyword_token_type(kw) for kw in KEYWORDS}
+
+OPERATOR_TT = {
+    '++': TokenType.INCREMENT, '--': TokenType.DECREMENT,
+    '+=': TokenType.PLUS_ASSIGN, '-=': TokenType.MINUS_ASSIGN,
+    '*=': TokenType.MULT_ASSIGN, '/=': TokenType.DIV_ASSIGN,
+    '%=': TokenType.MOD_ASSIGN, '==': TokenType.EQUAL,
+    '!=': TokenType.NOT_EQUAL, '<=': TokenType.LESS_EQUAL,
+    '>=': TokenType.GREATER_EQUAL, '&&': TokenType.LOGICAL_AND,
+    '||': TokenType.LOGICAL_OR, '<<': TokenType.LEFT_SHIFT,
+    '>>': TokenType.RIGHT_SHIFT, '->': TokenType.ARROW,
+    '+': TokenType.PLUS, '-': TokenType.MINUS, '*': TokenType.MULTIPLY,
+    '/': TokenType.DIVIDE, '%': TokenType.MODULO, '=': TokenType.ASSIGN,
+    '<': TokenType.LESS_THAN, '>': TokenType.GREATER_THAN,
+    '!': TokenType.LOGICAL_NOT, '&': TokenType.BITWISE_AND,
+    '|': TokenType.BITWISE_OR, '^': TokenType.BITWISE_XOR,
+    '~': TokenType.BITWISE_NOT, ';': TokenType.SEMICOLON,
+    ',': TokenType.COMMA, '.': TokenType.DOT, '?': TokenType.QUESTION,
+    ':': TokenType.COLON, '(': TokenType.LEFT_PAREN,
+    ')': TokenType.RIGHT_PAREN, '{': TokenType.LEFT_BRACE,
+    '}': TokenType.RIGHT_BRACE, '[': TokenType.LEFT_BRACKET,
+    ']': TokenType.RIGHT_BRACKET, '#': TokenType.HASH
+}
+
+# The operator alternation is generated from OPERATOR_TT so the set of
+# recognized operators has a single source of truth; sorting by descending
+# length guarantees longer operators match before their single-character
+# prefixes ('++' before '+').
+_OP_PATTERN = '|'.join(
+    re.escape(op) for op in sorted(OPERATOR_TT, key=len, reverse=True)
+).encode('ascii')
+
+# Master token pattern: a single alternation with named groups, so the whole
+# inner scanning loop runs inside the C-implemented regex engine instead of
+# one Python-level dispatch per character. The pattern is compiled over
+# bytes: scanning a bytes buffer avoids per-character str objects, and
+# lexemes are only decoded to str when a Token is actually built.
+TOKEN_RE = re.compile(rb"""
+    (?P<WS>\s+)
+  | (?P<BADCOMMENT>/\*)
+  | (?P<FLOAT>\d+\.\d*)
+  | (?P<INT>0[xX][0-9A-Fa-f]+|\d+)
+  | (?P<ID>[A-Za-z_]\w*)
+  | (?P<STR>"(?:\\.|[^"\\])*")
+  | (?P<CHR>'(?:\\.|[^'\\])*')
+  | (?P<BADSTR>["'])
+  | (?P<OP>""" + _OP_PATTERN + rb""")
+""", re.DOTALL | re.VERBOSE)
+
+# Comment stripper run once over the whole source before tokenizing, so the
+# master scan never sees a comment. String and char literals are matched
+# first (and kept) so comment markers inside them are left alone; comments
+# are blanked to spaces rather than deleted, keeping every byte offset — and
+# therefore the line/column math — identical to the original source. An
+# unterminated /* matches neither alternative and is caught by the master
+# pattern's BADCOMMENT group.
+_COMMENT_RE = re.compile(
+    rb'"(?:\\.|[^"\\])*"'
+    rb"|'(?:\\.|[^'\\])*'"
+    rb'|//[^\n]*'
+    rb'|/\*.*?\*/', re.DOTALL)
+
+_NON_NEWLINE_RE = re.compile(rb'[^\n]')
+
+def _strip_comments(source: bytes) -> bytes:
+    def replace(match):
+        text = match.group()
+        if text.startswith((b'//', b'/*')):
+            return _NON_NEWLINE_RE.sub(b' ', text)
+        return text  # string/char literal, kept verbatim
+    return _COMMENT_RE.sub(replace, source)
+
+_NEWLINE_RE = re.compile(rb'\n')
+
+def _int_literal(text: bytes) -> int:
+    """Convert a leading-zero integer lexeme: 0x hex, else C-style octal.
+
+    Lexemes like 099 are not valid octal; they fall back to decimal, which
+    matches how the lexer has always read them.
+    """
+    if text[1] in b'xX':
+        return int(text, 16)
+    try:
+        return int(text, 8)
+    except ValueError:
+        return int(text)
+
+# Escape sequence handling for string/char literals
+_ESCAPE_MAP = {'n': '\n', 't': '\t', 'r': '\r', '\\': '\\', '"': '"', "'": "'"}
+_ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+
+def _unescape(text: str) -> str:
+    """Process C escape sequences in a quoted literal body."""
+    return _ESCAPE_RE.sub(lambda m: _ESCAPE_MAP.get(m.group(1), m.group(1)), text)
+
 class Lexer:
-    """Lexical analyzer that converts C source code into tokens."""
-    
-    def __init__(self, source_code: str):
-        self.source = source_code
-        self.position = 0
-        self.line = 1
-        self.column = 1
-        self.tokens = []
-        
-        # C Keywords
-        self.keywords = {
-            'auto', 'break', 'case', 'char', 'const', 'continue', 'default', 'do',
-            'double', 'else', 'enum', 'extern', 'float', 'for', 'goto', 'if',
-            'int', 'long', 'register', 'return', 'short', 'signed', 'sizeof',
-            'static', 'struct', 'switch', 'typedef', 'union', 'unsigned', 'void',
-            'volatile', 'while'
-        }
-    
-    def current_char(self) -> str:
-        """Get current character or EOF."""
-        if self.position >= len(self.source):
-            return '\0'
-        return self.source[self.position]
-    
-    def peek_char(self, offset: int = 1) -> str:
-        """Look ahead at character without advancing position."""
-        peek_pos = self.position + offset
-        if peek_pos >= len(self.source):
-            return '\0'
-        return self.source[peek_pos]
-    
-    def advance(self) -> str:
-        """Move to next character and return current."""
-        if self.position >= len(self.source):
-            return '\0'
-        
-        char = self.source[self.position]
-        self.position += 1
-        
-        if char == '\n':
-            self.line += 1
-            self.column = 1
-        else:
-            self.column += 1
-        
-        return char
-    
-    def skip_whitespace(self):
-        """Skip whitespace characters."""
-        while self.current_char().isspace():
-            self.advance()
-    
-    def skip_comment(self):
-        """Skip single-line (//) and multi-line (/* */) comments."""
-        if self.current_char() == '/' and self.peek_char() == '/':
-            # Single-line comment
-            while self.current_char() != '\n' and self.current_char() != '\0':
-                self.advance()
-        elif self.current_char() == '/' and self.peek_char() == '*':
-            # Multi-line comment
-            self.advance()  # Skip '/'
-            self.advance()  # Skip '*'
-            
-            while True:
-                if self.current_char() == '\0':
-                    raise SyntaxError(f"Unterminated comment at line {self.line}")
-                if self.current_char() == '*' and self.peek_char() == '/':
-                    self.advance()  # Skip '*'
-                    self.advance()  # Skip '/'
-                    break
-                self.advance()
-    
-    def read_string(self) -> str:
-        """Read string literal."""
-        quote_char = self.advance()  # Skip opening quote
-        value = ""
-        
-        while self.current_char() != quote_char and self.current_char() != '\0':
-            if self.current_char() == '\\':
-                self.advance()  # Skip backslash
-                escaped = self.advance()
-                # Handle escape sequences
-                escape_map = {'n': '\n', 't': '\t', 'r': '\r', '\\': '\\', '"': '"', "'": "'"}
-                value += escape_map.get(escaped, escaped)
-            else:
-                value += self.advance()
-        
-        if self.current_char() != quote_char:
-            raise SyntaxError(f"Unterminated string at line {self.line}")
-        
-        self.advance()  # Skip closing quote
-        return value
-    
-    def read_number(self) -> Union[int, float]:
-        """Read integer or float literal."""
-        value = ""
-        is_float = False
-        
-        while self.current_char().isdigit() or self.current_char() == '.':
-            if self.current_char() == '.':
-                if is_float:
-                    break  # Second dot, stop reading
-                is_float = True
-            value += self.advance()
-        
-        return float(value) if is_float else int(value)
-    
-    def read_identifier(self) -> str:
-        """Read identifier or keyword."""
-        value = ""
-        
-        while (self.current_char().isalnum() or self.current_char() == '_'):
-            value += self.advance()
-        
-        return value
-    
-    def tokenize(self) -> List[Token]:
-        """Convert source code into list of tokens."""
+    """Lexical analyzer that converts C source code into tokens.
+
+    Uses a single compiled master regex (TOKEN_RE) so the hot scanning loop
+    iterates once per token instead of once per character. The source is
+    scanned as bytes; lexemes are decoded to str only when tokens are built.
+    """
+
+    def __init__(self, source_code: Union[str, bytes]):
+        if isinstance(source_code, str):
+            source_code = source_code.encode('utf-8')
+        self.source = _strip_comments(source_code)
         self.tokens = []
-        
-        while self.position < len(self.source):
-            start_line, start_col = self.line, self.column
-            
-            # Skip whitespace
-            if self.current_char().isspace():
-                self.skip_whitespace()
-                continue
-            
-            # Skip comments
-            if self.current_char() == '/' and (self.peek_char() == '/' or self.peek_char() == '*'):
-                self.skip_comment()
-                continue
-            
-            char = self.current_char()
-            
-            # String literals
-            if char in ['"', "'"]:
-                value = self.read_string()
-                token_type = TokenType.STRING if char == '"' else TokenType.CHAR
-                self.tokens.append(Token(token_type, value, start_line, start_col))
-            
-            # Numbers
-            elif char.isdigit():
-                value = self.read_number()
-                token_type = TokenType.FLOAT if isinstance(value, float) else TokenType.INTEGER
-                self.tokens.append(Token(token_type, str(value), start_line, start_col))
-            
-            # Identifiers and keywords
-            elif char.isalpha() or char == '_':
-                value = self.read_identifier()
-                if value in self.keywords:
-                    # Map keywords to their token types
-                    token_type = getattr(TokenType, value.upper(), None)
-                    if token_type is None:
-                        token_type = getattr(TokenType, value.upper() + '_KW', TokenType.IDENTIFIER)
-                else:
-                    token_type = TokenType.IDENTIFIER
-                self.tokens.append(Token(token_type, value, start_line, start_col))
-            
-            # Two-character operators
-            elif char == '+' and self.peek_char() == '+':
-                self.advance(); self.advance()
-                self.tokens.append(Token(TokenType.INCREMENT, "++", start_line, start_col))
-            elif char == '-' and self.peek_char() == '-':
-                self.advance(); self.advance() 
-                self.tokens.append(Token(TokenType.DECREMENT, "--", start_line, start_col))
-            elif char == '+' and self.peek_char() == '=':
-                self.advance(); self.advance()
-                self.tokens.append(Token(TokenType.PLUS_ASSIGN, "+=", start_line, start_col))
-            elif char == '-' and self.peek_char() == '=':
-                self.advance(); self.advance()
-                self.tokens.append(Token(TokenType.MINUS_ASSIGN, "-=", start_line, start_col))
-            elif char == '*' and self.peek_char() == '=':
-                self.advance(); self.advance()
-                self.tokens.append(Token(TokenType.MULT_ASSIGN, "*=", start_line, start_col))
-            elif char == '/' and self.peek_char() == '=':
-                self.advance(); self.advance()
-                self.tokens.append(Token(TokenType.DIV_ASSIGN, "/=", start_line, start_col))
-            elif char == '%' and self.peek_char() == '=':
-                self.advance(); self.advance()
-                self.tokens.append(Token(TokenType.MOD_ASSIGN, "%=", start_line, start_col))
-            elif char == '=' and self.peek_char() == '=':
-                self.advance(); self.advance()
-                self.tokens.append(Token(TokenType.EQUAL, "==", start_line, start_col))
-            elif char == '!' and self.peek_char() == '=':
-                self.advance(); self.advance()
-                self.tokens.append(Token(TokenType.NOT_EQUAL, "!=", start_line, start_col))
-            elif char == '<' and self.peek_char() == '=':
-                self.advance(); self.advance()
-                self.tokens.append(Token(TokenType.LESS_EQUAL, "<=", start_line, start_col))
-            elif char == '>' and self.peek_char() == '=':
-                self.advance(); self.advance()
-                self.tokens.append(Token(TokenType.GREATER_EQUAL, ">=", start_line, start_col))
-            elif char == '&' and self.peek_char() == '&':
-                self.advance(); self.advance()
-                self.tokens.append(Token(TokenType.LOGICAL_AND, "&&", start_line, start_col))
-            elif char == '|' and self.peek_char() == '|':
-                self.advance(); self.advance()
-                self.tokens.append(Token(TokenType.LOGICAL_OR, "||", start_line, start_col))
-            elif char == '<' and self.peek_char() == '<':
-                self.advance(); self.advance()
-                self.tokens.append(Token(TokenType.LEFT_SHIFT, "<<", start_line, start_col))
-            elif char == '>' and self.peek_char() == '>':
-                self.advance(); self.advance()
-                self.tokens.append(Token(TokenType.RIGHT_SHIFT, ">>", start_line, start_col))
-            elif char == '-' and self.peek_char() == '>':
-                self.advance(); self.advance()
-                self.tokens.append(Token(TokenType.ARROW, "->", start_line, start_col))
-            
-            # Single-character operators and punctuation
-            else:
-                self.advance()
-                token_map = {
-                    '+': TokenType.PLUS, '-': TokenType.MINUS, '*': TokenType.MULTIPLY,
-                    '/': TokenType.DIVIDE, '%': TokenType.MODULO, '=': TokenType.ASSIGN,
-                    '<': TokenType.LESS_THAN, '>': TokenType.GREATER_THAN,
-                    '!': TokenType.LOGICAL_NOT, '&': TokenType.BITWISE_AND,
-                    '|': TokenType.BITWISE_OR, '^': TokenType.BITWISE_XOR,
-                    '~': TokenType.BITWISE_NOT, ';': TokenType.SEMICOLON,
-                    ',': TokenType.COMMA, '.': TokenType.DOT, '?': TokenType.QUESTION,
-                    ':': TokenType.COLON, '(': TokenType.LEFT_PAREN,
-                    ')': TokenType.RIGHT_PAREN, '{': TokenType.LEFT_BRACE,
-                    '}': TokenType.RIGHT_BRACE, '[': TokenType.LEFT_BRACKET,
-                    ']': TokenType.RIGHT_BRACKET, '#': TokenType.HASH
-                }
-                
-                token_type = token_map.get(char)
-                if token_type:
-                    self.tokens.append(Token(token_type, char, start_line, start_col))
+        # Structure-of-arrays view of the token stream, derived lazily from
+        # self.tokens on first access (see the properties below). Scanning
+        # token types sequentially through a compact int array is far more
+        # cache-friendly than chasing one Token object per element, but the
+        # parser keeps its own view, so eager construction would just add
+        # four dead passes per compile.
+        self._types = None
+        self._values = None
+        self._lines = None
+        self._columns = None
+
+    def scan(self):
+        """Yield tokens one at a time without materializing the stream.
+
+        Streaming consumers (or pipelines that interleave lexing with other
+        work) can pull from this generator directly; tokenize() wraps it for
+        callers that want the whole list.
+        """
+        # Bind hot names to locals so the per-token loop avoids repeated
+        # attribute/global lookups (the dict lookups below are the fast path).
+        intern = sys.intern
+        Tok = Token
+        keyword_get = KEYWORD_TT.get
+        operator_tt = OPERATOR_TT
+        tt_identifier = TokenType.IDENTIFIER
+        tt_integer = TokenType.INTEGER
+        tt_float = TokenType.FLOAT
+        tt_string = TokenType.STRING
+        tt_char = TokenType.CHAR
+        source = self.source
+        position = 0
+
+        # Line-start offset table: token positions translate to (line, col)
+        # with one C-level bisect per emitted token, replacing the
+        # count/rfind newline bookkeeping that ran on every match (including
+        # skipped whitespace).
+        line_starts = [0]
+        line_starts.extend(m.end() for m in _NEWLINE_RE.finditer(source))
+        locate = bisect.bisect_right
+
+        for match in TOKEN_RE.finditer(source):
+            start = match.start()
+            if start != position:
+                line = locate(line_starts, position)
+                raise SyntaxError(
+                    f"Unknown character '{chr(source[position])}' at line {line}, "
+                    f"column {position - line_starts[line - 1] + 1}")
+            position = match.end()
+
+            group = match.lastgroup
+            text = match.group()
+
+            if group == 'WS':
+                continue  # No token, no location to compute
+            line = locate(line_starts, start)
+            column = start - line_starts[line - 1] + 1
+
+            if group == 'ID':
+                # Interning deduplicates repeated identifiers/keywords so all
+                # tokens for the same lexeme share one string object.
+                value = intern(text.decode('utf-8'))
+                yield Tok(keyword_get(value, tt_identifier), value, line, column)
+            elif group == 'OP':
+                value = intern(text.decode('utf-8'))
+                yield Tok(operator_tt[value], value, line, column)
+            elif group == 'INT':
+                # Convert eagerly: int()/float() accept the bytes lexeme
+                # directly, and the parser then reads a typed value instead
+                # of re-parsing the digits. Leading-zero lexemes take the
+                # hex/octal path.
+                if text[0] == 48 and len(text) > 1:  # starts with b'0'
+                    value = _int_literal(text)
                 else:
-                    raise SyntaxError(f"Unknown character '{char}' at line {self.line}, column {self.column}")
-        
+                    value = int(text)
+                yield Tok(tt_integer, value, line, column)
+            elif group == 'FLOAT':
+                yield Tok(tt_float, float(text), line, column)
+            elif group == 'STR':
+                # Most literals contain no escapes; check the raw bytes once
+                # and skip the substitution pass entirely when clean.
+                body = text[1:-1].decode('utf-8')
+                if b'\\' in text:
+                    body = _unescape(body)
+                yield Tok(tt_string, body, line, column)
+            elif group == 'CHR':
+                body = text[1:-1].decode('utf-8')
+                if b'\\' in text:
+                    body = _unescape(body)
+                yield Tok(tt_char, body, line, column)
+            elif group == 'BADCOMMENT':
+                raise SyntaxError(f"Unterminated comment at line {line}")
+            else:  # BADSTR
+                raise SyntaxError(f"Unterminated string at line {line}")
+
+        if position != len(source):
+            line = locate(line_starts, position)
+            raise SyntaxError(
+                f"Unknown character '{chr(source[position])}' at line {line}, "
+                f"column {position - line_starts[line - 1] + 1}")
+
         # Add EOF token
-        self.tokens.append(Token(TokenType.EOF, "", self.line, self.column))
+        end = len(source)
+        line = locate(line_starts, end)
+        yield Token(TokenType.EOF, "", line, end - line_starts[line - 1] + 1)
+
+    def tokenize(self) -> List[Token]:
+        """Convert source code into list of tokens."""
+        self.tokens = list(self.scan())
+        # Drop any views derived from a previous token list.
+        self._types = None
+        self._values = None
+        self._lines = None
+        self._columns = None
         return self.tokens
 
+    # Structure-of-arrays views, built on first access; consumers that only
+    # need types (or positions) can scan these without touching the Token
+    # objects at all.
+    @property
+    def types(self) -> array.array:
+        if self._types is None:
+            self._types = array.array('h', [t.type for t in self.tokens])
+        return self._types
+
+    @property
+    def values(self) -> list:
+        if self._values is None:
+            self._values = [t.value for t in self.tokens]
+        return self._values
+
+    @property
+    def lines(self) -> array.array:
+        if self._lines is None:
+            self._lines = array.array('i', [t.line for t in self.tokens])
+        return self._lines
+
+    @property
+    def columns(self) -> array.array:
+        if self._columns is None:
+            self._columns = array.array('i', [t.column for t in self.tokens])
+        return self._columns
+
 # ============================================================================
 # MAIN COMPILER CLASS
 # ============================================================================
@@ -4322,8 +4624,9 @@ class CCompiler:
     def compile(self, source_file: str, output_file: str = None) -> bool:
         """Compile C source file to executable."""
         try:
-            # Read source code
-            with open(source_file, 'r') as f:
+            # Read source code as raw bytes; the lexer scans bytes directly
+            # and decodes individual lexemes on demand
+            with open(source_file, 'rb') as f:
                 source_code = f.read()
             
             print(f"🚀 Compiling {source_file}...")
@@ -134,8 +134,8 @@ class SoundSystem:
             
             for sound_name, (frequency, duration) in simple_sounds.items():
                 frames = int(sample_rate * duration)
-                raw_data = b''
-                
+                raw_chunks = []
+
                 for i in range(frames):
                     time_val = float(i) / sample_rate
                     # Generate sine wave
@@ -152,11 +152,11 @@ class SoundSystem:
                     # Scale and convert to 16-bit
                     sample = int(wave_val * envelope * 16384 * self.volume)
                     # Pack as stereo 16-bit samples
-                    raw_data += struct.pack('<hh', sample, sample)
-                
+                    raw_chunks.append(struct.pack('<hh', sample, sample))
+
                 # Create pygame sound from raw data
                 try:
-                    sound = pygame.mixer.Sound(buffer=raw_data)
+                    sound = pygame.mixer.Sound(buffer=b''.join(raw_chunks))
                     self.sound_data[sound_name] = sound
                     print(f"Generated {sound_name} sound ({frequency}Hz, {duration}s)")
                 except Exception as e:
@@ -215,7 +215,7 @@ class SoundSystem:
             
             for stage in range(1, 6):
                 theme = stage_themes[stage]
-                raw_data = b''
+                raw_chunks = []
                 
                 chord_duration = duration / 4  # 4 chords per loop
                 
@@ -338,11 +338,11 @@ class SoundSystem:
                     
                     # Convert to 16-bit stereo
                     sample_16bit = int(final_sample * 20000)  # Reasonable volume
-                    raw_data += struct.pack('<hh', sample_16bit, sample_16bit)
-                
+                    raw_chunks.append(struct.pack('<hh', sample_16bit, sample_16bit))
+
                 # Create pygame sound from raw data
                 try:
-                    bg_sound = pygame.mixer.Sound(buffer=raw_data)
+                    bg_sound = pygame.mixer.Sound(buffer=b''.join(raw_chunks))
                     self.sound_data[f'bg_stage_{stage}'] = bg_sound
                     print(f"Generated realistic background music: {theme['name']} (Stage {stage})")
                 except Exception as e:
@@ -363,7 +363,7 @@ class SoundSystem:
             
             total_duration = sum([dur for _, dur in freq_duration_list]) + 0.05
             frames = int(sample_rate * total_duration)
-            raw_data = b''
+            raw_chunks = []
             
             for i in range(frames):
                 time_val = float(i) / sample_rate
@@ -401,9 +401,9 @@ class SoundSystem:
                 sample = max(-0.8, min(0.8, sample))  # Limiting
                 
                 sample_16bit = int(sample * 20000)
-                raw_data += struct.pack('<hh', sample_16bit, sample_16bit)
-            
-            sound = pygame.mixer.Sound(buffer=raw_data)
+                raw_chunks.append(struct.pack('<hh', sample_16bit, sample_16bit))
+
+            sound = pygame.mixer.Sound(buffer=b''.join(raw_chunks))
             self.sound_data[sound_name] = sound
             print(f"Generated realistic eating sound with crunch effect")
             
@@ -421,7 +421,7 @@ class SoundSystem:
             
             total_duration = sum([dur for _, dur in freq_duration_list]) + 0.1
             frames = int(sample_rate * total_duration)
-            raw_data = b''
+            raw_chunks = []
             
             for i in range(frames):
                 time_val = float(i) / sample_rate
@@ -463,9 +463,9 @@ class SoundSystem:
                 sample = max(-0.7, min(0.7, sample))  # Limiting
                 
                 sample_16bit = int(sample * 22000)
-                raw_data += struct.pack('<hh', sample_16bit, sample_16bit)
-            
-            sound = pygame.mixer.Sound(buffer=raw_data)
+                raw_chunks.append(struct.pack('<hh', sample_16bit, sample_16bit))
+
+            sound = pygame.mixer.Sound(buffer=b''.join(raw_chunks))
             self.sound_data[sound_name] = sound
             print(f"Generated rich bonus food sound with sparkle effects")
             
@@ -482,7 +482,7 @@ class SoundSystem:
             
             total_duration = sum([dur for _, dur in freq_duration_list]) + 0.2
             frames = int(sample_rate * total_duration)
-            raw_data = b''
+            raw_chunks = []
             
             # Extract stage number from sound_name (e.g., 'stage_up_1' -> 1)
             stage_num = int(sound_name.split('_')[-1])
@@ -534,9 +534,9 @@ class SoundSystem:
                 sample = max(-0.6, min(0.6, sample))  # Gentle limiting
                 
                 sample_16bit = int(sample * 18000)
-                raw_data += struct.pack('<hh', sample_16bit, sample_16bit)
-            
-            sound = pygame.mixer.Sound(buffer=raw_data)
+                raw_chunks.append(struct.pack('<hh', sample_16bit, sample_16bit))
+
+            sound = pygame.mixer.Sound(buffer=b''.join(raw_chunks))
             self.sound_data[sound_name] = sound
             print(f"Generated stage {stage_num} progression sound with thematic character")
             